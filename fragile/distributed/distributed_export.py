@@ -70,9 +70,12 @@ class DistributedExport:
             for _ in range(n_swarms)
         ]
         self.n_swarms = n_swarms
-        self.minimize = ray.get(self.swarms[0].get.remote("minimize"))
-        self.max_epochs = ray.get(self.swarms[0].get.remote("max_epochs"))
-        self.reward_limit = ray.get(self.swarms[0].get.remote("reward_limit"))
+        swarm_params = ray.get(
+            self.swarms[0].get_many.remote(["minimize", "max_epochs", "reward_limit"])
+        )
+        self.minimize = swarm_params["minimize"]
+        self.max_epochs = swarm_params["max_epochs"]
+        self.reward_limit = swarm_params["reward_limit"]
         self.param_server = RemoteParamServer.remote(
             max_len=max_len, minimize=self.minimize, add_global_best=add_global_best
         )
@@ -95,8 +98,8 @@ class DistributedExport:
         self._epoch = 0
         reset_param_server = self.param_server.reset.remote()
         reset_swarms = [swarm.reset.remote(root_walker=root_walker) for swarm in self.swarms]
-        ray.get(reset_param_server)
-        ray.get(reset_swarms)
+        # All the remote calls are dispatched before waiting for them to finish.
+        ray.get([reset_param_server] + reset_swarms)
 
     def run(self, root_walker: OneWalker = None, report_interval=None):
         """
@@ -116,19 +119,26 @@ class DistributedExport:
         for swarm in self.swarms:
             steps[swarm.run_exchange_step.remote(current_import_walkers)] = swarm
 
-        for i in range(self.max_epochs * self.n_swarms):
-            self._epoch = i // self.n_swarms
-            ready_export_walkers, _ = ray.wait(list(steps))
-            ready_export_walker_id = ready_export_walkers[0]
-            swarm = steps.pop(ready_export_walker_id)
-
-            # Compute and apply gradients.
-            current_import_walkers = self.param_server.exchange_walkers.remote(
-                ready_export_walker_id
-            )
-            steps[swarm.run_exchange_step.remote(current_import_walkers)] = swarm
-
-            if self.epoch % report_interval == 0 and self.epoch > 0:
-                # Evaluate the current model after every 10 updates.
-                best = self.get_best()
-                print("iter {} best_reward: {}".format(i, best.rewards))
+        n_steps, i = self.max_epochs * self.n_swarms, 0
+        while i < n_steps:
+            # Process all the swarms that have already finished in a single call, and
+            # only block waiting for one swarm when none of them is ready.
+            num_returns = min(len(steps), n_steps - i)
+            ready_export_walkers, _ = ray.wait(list(steps), num_returns=num_returns, timeout=0)
+            if not ready_export_walkers:
+                ready_export_walkers, _ = ray.wait(list(steps), num_returns=1)
+            for ready_export_walker_id in ready_export_walkers:
+                self._epoch = i // self.n_swarms
+                swarm = steps.pop(ready_export_walker_id)
+
+                # Compute and apply gradients.
+                current_import_walkers = self.param_server.exchange_walkers.remote(
+                    ready_export_walker_id
+                )
+                steps[swarm.run_exchange_step.remote(current_import_walkers)] = swarm
+
+                if self.epoch % report_interval == 0 and self.epoch > 0:
+                    # Evaluate the current model after every 10 updates.
+                    best = self.get_best()
+                    print("iter {} best_reward: {}".format(i, best.rewards))
+                i += 1
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Dict, Iterable
 
 from fragile.distributed.export_swarm import (
     ExportedWalkers,
@@ -58,10 +58,13 @@ class ExportSwarm:
             import_best=import_best,
             export_best=export_best,
         )
+        # Maps attribute names to the object that contains them to speed up ``get``.
+        self._attr_map = {}
 
     def reset(self, *args, **kwargs):
         """Reset the internal :class:`ExportSwarm`."""
         self.swarm.reset(*args, **kwargs)
+        self._attr_map = {}
 
     # Ray does not allow to implement static methods in remote classes.
     def get_empty_export_walkers(self) -> ExportedWalkers:
@@ -76,17 +79,30 @@ class ExportSwarm:
         """Run a the walkers import/export process of the internal :class:`ExportSwarm`."""
         return self.swarm.run_exchange_step(walkers)
 
-    def get(self, name: str):
-        """Access attributes of the underlying :class:`ExportSwarm`."""
+    def _find_attr_owner(self, name: str):
+        """Return the object that contains the target attribute."""
         if hasattr(self.swarm.walkers.states, name):
-            return getattr(self.swarm.walkers.states, name)
+            return self.swarm.walkers.states
         elif hasattr(self.swarm.walkers.env_states, name):
-            return getattr(self.swarm.walkers.env_states, name)
+            return self.swarm.walkers.env_states
         elif hasattr(self.swarm.walkers.model_states, name):
-            return getattr(self.swarm.walkers.model_states, name)
+            return self.swarm.walkers.model_states
         elif hasattr(self.swarm.walkers, name):
-            return getattr(self.swarm.walkers, name)
+            return self.swarm.walkers
         elif hasattr(self.swarm, name):
-            return getattr(self.swarm, name)
+            return self.swarm
         else:
             raise ValueError("%s is not an attribute of the states, swarm or walkers." % name)
+
+    def get(self, name: str):
+        """Access attributes of the underlying :class:`ExportSwarm`."""
+        if name not in self._attr_map:
+            self._attr_map[name] = self._find_attr_owner(name)
+        return getattr(self._attr_map[name], name)
+
+    def get_many(self, names: Iterable[str]) -> Dict[str, object]:
+        """
+        Access several attributes of the underlying :class:`ExportSwarm` with \
+        a single remote call.
+        """
+        return {name: self.get(name) for name in names}
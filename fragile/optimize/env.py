@@ -1,7 +1,12 @@
+from multiprocessing.pool import Pool, ThreadPool
+import os
+import pickle
 from typing import Callable, Dict, Tuple, Union
+import weakref
 
 import judo
 from judo import Backend, Bounds, tensor, typing
+from numba import jit
 import numpy
 from scipy.optimize import Bounds as ScipyBounds
 from scipy.optimize import minimize
@@ -10,6 +15,18 @@ from fragile.core.env import Environment
 from fragile.core.states import StatesEnv, StatesModel
 
 
+@jit(nopython=True)
+def _points_out_of_bounds(points: numpy.ndarray, low: numpy.ndarray, high: numpy.ndarray):
+    """Return an array of booleans that is ``True`` for the points outside the bounds."""
+    oobs = numpy.zeros(points.shape[0], dtype=numpy.bool_)
+    for i in range(points.shape[0]):
+        for j in range(points.shape[1]):
+            if not (low[j] <= points[i, j] <= high[j]):  # NaN values are out of bounds
+                oobs[i] = True
+                break
+    return oobs
+
+
 class Function(Environment):
     """
     Environment that represents an arbitrary mathematical function bounded in a \
@@ -152,8 +169,9 @@ class Function(Environment):
              "oobs": boolean array}``
 
         """
+        # new_points is returned as the new states, so it cannot be a reused buffer.
         new_points = actions + observs if self._actions_as_perturbations else actions
-        rewards = self.function(new_points).flatten()
+        rewards = self.function(new_points).reshape(-1)  # Avoid the copy of flatten()
         oobs = self.calculate_oobs(points=new_points, rewards=rewards)
         data = {"states": new_points, "observs": new_points, "rewards": rewards, "oobs": oobs}
         return data
@@ -175,7 +193,7 @@ class Function(Environment):
         """
         oobs = judo.zeros(batch_size, dtype=judo.bool)
         new_points = self.sample_bounds(batch_size=batch_size)
-        rewards = self.function(new_points).flatten()
+        rewards = self.function(new_points).reshape(-1)
         new_states = self.states_from_data(
             states=new_points,
             observs=new_points,
@@ -200,7 +218,10 @@ class Function(Environment):
             and ``False`` otherwise.
 
         """
-        oobs = judo.logical_not(self.bounds.points_in_bounds(points)).flatten()
+        if Backend.is_numpy() and len(points.shape) == 2:
+            oobs = _points_out_of_bounds(points, self.bounds.low, self.bounds.high)
+        else:
+            oobs = judo.logical_not(self.bounds.points_in_bounds(points)).flatten()
         if self.custom_domain_check is not None:
             points_in_bounds = judo.logical_not(oobs)
             oobs[points_in_bounds] = self.custom_domain_check(
@@ -221,22 +242,24 @@ class Function(Environment):
             :class:`Function` domain, stacked across the first dimension.
 
         """
-        new_points = judo.zeros(tuple([batch_size]) + self.shape, dtype=judo.float32)
-        for i in range(batch_size):
-            values = self.random_state.uniform(
-                low=judo.astype(self.bounds.low, judo.float),
-                high=judo.astype(self.bounds.high, judo.float32),
-            )
-            values = judo.astype(values, self.bounds.low.dtype)
-            new_points[i, :] = values
-
-        return new_points
+        low = judo.astype(self.bounds.low, judo.float32)
+        high = judo.astype(self.bounds.high, judo.float32)
+        width = high - low
+        if not numpy.isfinite(judo.to_numpy(width)).all():
+            raise OverflowError("Range exceeds valid bounds")
+        # Sample all the walkers at once scaling a unit uniform sample, so the
+        # bounds broadcast across the batch dimension for every backend.
+        # The scaling is done in place to avoid allocating temporary arrays.
+        new_points = self.random_state.random_sample(tuple([batch_size]) + self.shape)
+        new_points *= width
+        new_points += low
+        return judo.astype(new_points, judo.float32)
 
 
 class Minimizer:
     """Apply ``scipy.optimize.minimize`` to a :class:`Function`."""
 
-    def __init__(self, function: Function, bounds=None, *args, **kwargs):
+    def __init__(self, function: Function, bounds=None, *args, n_jobs: int = 1, **kwargs):
         """
         Initialize a :class:`Minimizer`.
 
@@ -246,14 +269,91 @@ class Minimizer:
                     process. If it is ``None`` the :class:`Function` :class:`Bounds` \
                     will be used.
             *args: Passed to ``scipy.optimize.minimize``.
+            n_jobs: Number of workers used to minimize a batch of points in \
+                    parallel. If it is ``1`` the points are minimized sequentially, \
+                    and if it is ``None`` one worker per cpu will be used. \
+                    Negative values follow the joblib convention: ``-1`` uses \
+                    all the cpus, ``-2`` all the cpus but one, and so on.
             **kwargs: Passed to ``scipy.optimize.minimize``.
 
         """
         self.env = function
         self.function = function.function
         self.bounds = self.env.bounds if bounds is None else bounds
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+        elif n_jobs == 0:
+            raise ValueError("n_jobs must be a positive integer, a negative integer or None.")
+        self.n_jobs = n_jobs
         self.args = args
         self.kwargs = kwargs
+        self._pool = None
+        self._pool_finalizer = None
+
+    @property
+    def bounds(self) -> Bounds:
+        """Return the :class:`Bounds` that define the domain of the minimization process."""
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, bounds: Bounds):
+        """Set new :class:`Bounds` and update the bounds passed to ``scipy.optimize.minimize``."""
+        self._bounds = bounds
+        self._scipy_bounds_key = None
+        self._update_scipy_bounds()
+
+    def _update_scipy_bounds(self) -> ScipyBounds:
+        """
+        Return the bounds passed to ``scipy.optimize.minimize``.
+
+        They are rebuilt only when ``bounds``, ``bounds.low`` or ``bounds.high`` \
+        are assigned a new value. Modifying the values of ``bounds.low`` or \
+        ``bounds.high`` in place will not be detected.
+        """
+        bounds = self._bounds
+        low, high = (bounds.low, bounds.high) if bounds is not None else (None, None)
+        key = self._scipy_bounds_key
+        if key is None or key[0] is not low or key[1] is not high:
+            self._scipy_bounds = ScipyBounds(
+                ub=judo.to_numpy(high) if bounds is not None else None,
+                lb=judo.to_numpy(low) if bounds is not None else None,
+            )
+            # Keep references to the bounds so their identity is not reused.
+            self._scipy_bounds_key = (low, high)
+        return self._scipy_bounds
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Pools cannot be sent to the worker processes.
+        state["_pool"], state["_pool_finalizer"] = None, None
+        return state
+
+    @property
+    def pool(self) -> Pool:
+        """
+        Return the pool of workers used to minimize batches of points.
+
+        A process pool is used when the :class:`Minimizer` (including the \
+        target :class:`Function` and the arguments passed to \
+        ``scipy.optimize.minimize``) can be pickled. Otherwise it falls back \
+        to a pool of threads.
+        """
+        if self._pool is None:
+            try:
+                pickle.dumps(self)
+                pool_class = Pool
+            except (pickle.PicklingError, AttributeError, TypeError):
+                pool_class = ThreadPool
+            self._pool = pool_class(processes=self.n_jobs)
+            # Terminate the workers when the Minimizer is garbage collected or at exit.
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self) -> None:
+        """Terminate the pool of workers used to minimize batches, if any."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool, self._pool_finalizer = None, None
 
     def minimize(self, x: typing.Tensor):
         """
@@ -275,10 +375,7 @@ class Minimizer:
                 y = numpy.inf
             return y
 
-        bounds = ScipyBounds(
-            ub=judo.to_numpy(self.bounds.high) if self.bounds is not None else None,
-            lb=judo.to_numpy(self.bounds.low) if self.bounds is not None else None,
-        )
+        bounds = self._update_scipy_bounds()
         return minimize(_optimize, x, bounds=bounds, *self.args, **self.kwargs)
 
     def minimize_point(self, x: typing.Tensor) -> Tuple[typing.Tensor, typing.Scalar]:
@@ -298,6 +395,12 @@ class Minimizer:
         reward = tensor(float(optim_result["fun"]))
         return point, reward
 
+    def _minimize_point_numpy(self, x: numpy.ndarray) -> Tuple[numpy.ndarray, float]:
+        """Minimize one point inside a worker, where the backend needs to be set again."""
+        with Backend.use_backend("numpy"):
+            new_x, reward = self.minimize_point(x)
+        return new_x, float(reward)
+
     def minimize_batch(self, x: typing.Tensor) -> Tuple[typing.Tensor, typing.Tensor]:
         """
         Minimize a batch of points.
@@ -311,16 +414,21 @@ class Minimizer:
             and an array with the values assigned to each of the points found.
 
         """
-        x = judo.to_numpy(judo.copy(x))
+        # The points are only read, so there is no need to copy them.
+        x = judo.to_numpy(x)
         with Backend.use_backend("numpy"):
-            result = judo.zeros_like(x)
-            rewards = judo.zeros((x.shape[0], 1))
-            for i in range(x.shape[0]):
-                new_x, reward = self.minimize_point(x[i, :])
+            result = judo.empty_like(x)
+            rewards = judo.empty((x.shape[0], 1))
+            if self.n_jobs != 1 and x.shape[0] >= 4:
+                optimized = self.pool.map(self._minimize_point_numpy, x)
+            else:
+                optimized = (self.minimize_point(x[i, :]) for i in range(x.shape[0]))
+            for i, (new_x, reward) in enumerate(optimized):
                 result[i, :] = new_x
                 rewards[i, :] = float(reward)
         self.bounds.high = tensor(self.bounds.high)
         self.bounds.low = tensor(self.bounds.low)
+        self._update_scipy_bounds()
         result, rewards = tensor(result), tensor(rewards)
         return result, rewards
 
@@ -68,6 +68,14 @@ class TestExportInterface:
         swarm_attr = ray.get(export_swarm.get.remote("n_import"))
         assert dtype.is_int(swarm_attr)
 
+    def test_get_many(self, export_swarm):
+        names = ["cum_rewards", "minimize", "n_import"]
+        values = ray.get(export_swarm.get_many.remote(names))
+        assert list(values.keys()) == names
+        assert dtype.is_tensor(values["cum_rewards"])
+        assert values["minimize"] == ray.get(export_swarm.get.remote("minimize"))
+        assert values["n_import"] == ray.get(export_swarm.get.remote("n_import"))
+
     def test_get_empty_walkers(self, export_swarm):
         walkers = ray.get(export_swarm.get_empty_export_walkers.remote())
         assert isinstance(walkers, ExportedWalkers)
@@ -1,5 +1,7 @@
+import numpy
 import pytest
 
+from fragile.distributed import distributed_export
 from fragile.distributed.distributed_export import BestWalker, DistributedExport
 from tests.distributed.ray import init_ray, ray
 
@@ -70,3 +72,62 @@ class TestExportInterface:
         assert reward > target_score, "Iters: {}, rewards: {}".format(
             swarm.walkers.epoch, swarm.walkers.states.cum_rewards
         )
+
+
+class _RemoteCall:
+    def __init__(self, func):
+        self.remote = func
+
+
+class FakeRay:
+    """Mimic ``ray.wait`` with object refs that are always ready."""
+
+    def __init__(self):
+        self.n_waits = 0
+
+    def wait(self, refs, num_returns=1, timeout=None):
+        self.n_waits += 1
+        return list(refs)[:num_returns], list(refs)[num_returns:]
+
+    @staticmethod
+    def get(refs):
+        return refs
+
+
+class FakeSwarm:
+    def __init__(self):
+        self.n_steps = 0
+        self.reset = _RemoteCall(lambda root_walker=None: None)
+        self.get_empty_export_walkers = _RemoteCall(lambda: object())
+        self.run_exchange_step = _RemoteCall(self._run_exchange_step)
+
+    def _run_exchange_step(self, walkers):
+        self.n_steps += 1
+        return object()
+
+
+class FakeParamServer:
+    def __init__(self):
+        self.n_exchanges = 0
+        self.reset = _RemoteCall(lambda: None)
+        self.exchange_walkers = _RemoteCall(self._exchange_walkers)
+
+    def _exchange_walkers(self, walkers):
+        self.n_exchanges += 1
+        return object()
+
+
+def test_run_processes_ready_swarms_together(monkeypatch):
+    fake_ray = FakeRay()
+    monkeypatch.setattr(distributed_export, "ray", fake_ray)
+    export = DistributedExport.__new__(DistributedExport)
+    export.swarms = [FakeSwarm() for _ in range(3)]
+    export.n_swarms, export.max_epochs, export.report_interval = 3, 5, numpy.inf
+    export.param_server = FakeParamServer()
+    export._epoch = 0
+    export.run()
+    # All the swarms are ready at once, so each call to ray.wait handles all of them.
+    assert fake_ray.n_waits == export.max_epochs
+    assert export.param_server.n_exchanges == export.max_epochs * export.n_swarms
+    assert all(swarm.n_steps == export.max_epochs + 1 for swarm in export.swarms)
+    assert export.epoch == export.max_epochs - 1
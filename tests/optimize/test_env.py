@@ -2,11 +2,12 @@ from typing import Callable
 
 import judo
 from judo import Backend, Bounds, functions, tensor
+import numpy
 import pytest
 
 from fragile.core.states import StatesEnv, StatesModel
 from fragile.optimize.benchmarks import sphere
-from fragile.optimize.env import Function, MinimizerWrapper
+from fragile.optimize.env import Function, Minimizer, MinimizerWrapper
 from tests.core.test_env import TestEnvironment
 
 N_WALKERS = 50
@@ -117,6 +118,28 @@ class TestFunction:
         assert new_states.observs.shape[0] == batch_s
         assert new_states.observs.shape[1] == 2
 
+    @pytest.mark.parametrize("batch_s", [1, 10])
+    def test_sample_bounds(self, function_env, batch_s):
+        points = function_env.sample_bounds(batch_size=batch_s)
+        assert points.shape == (batch_s, 2)
+        assert points.dtype == judo.float32
+        assert function_env.bounds.points_in_bounds(points).all().item()
+
+    @pytest.mark.parametrize("low", [numpy.NINF, 0])
+    def test_sample_unbounded_domain(self, low):
+        env = Function.from_bounds_params(function=sphere, shape=(2,), low=low)
+        with pytest.raises(OverflowError):
+            env.sample_bounds(batch_size=N_WALKERS)
+
+    def test_calculate_oobs(self, function_env, batch_size):
+        points = judo.astype(function_env.sample_bounds(batch_size=batch_size) * 2, judo.float)
+        points[0, :] = function_env.bounds.high
+        oobs = function_env.calculate_oobs(points, rewards=judo.zeros(batch_size))
+        expected = judo.logical_not(function_env.bounds.points_in_bounds(points))
+        assert oobs.shape == (batch_size,)
+        assert not oobs[0].item()
+        assert (oobs == expected).all().item()
+
     def test_step(self, function_env, batch_size):
         states = function_env.reset(batch_size=batch_size)
         actions = StatesModel(
@@ -140,3 +163,51 @@ class TestFunction:
         assert minim.shape == minim.shape
         states = minim.step(model_states=states, env_states=minim.reset(N_WALKERS))
         assert judo.allclose(states.rewards.min(), 0)
+
+    @pytest.mark.skipif(not Backend.is_numpy(), reason="only in numpy for now")
+    def test_minimizer_parallel_batch(self):
+        bounds = Bounds(shape=(2,), high=10, low=-5, dtype=judo.float)
+        env = Function(function=sphere, bounds=bounds)
+        points = judo.astype(env.sample_bounds(N_WALKERS), judo.float64)
+        serial_x, serial_rewards = Minimizer(env).minimize_batch(points)
+        minimizer = Minimizer(env, n_jobs=2)
+        parallel_x, parallel_rewards = minimizer.minimize_batch(points)
+        minimizer.close()
+        assert judo.allclose(serial_x, parallel_x)
+        assert judo.allclose(serial_rewards, parallel_rewards)
+
+    @pytest.mark.skipif(not Backend.is_numpy(), reason="only in numpy for now")
+    def test_minimizer_parallel_unpicklable_kwargs(self):
+        bounds = Bounds(shape=(2,), high=10, low=-5, dtype=judo.float)
+        env = Function(function=sphere, bounds=bounds)
+        points = judo.astype(env.sample_bounds(N_WALKERS), judo.float64)
+        minimizer = Minimizer(env, n_jobs=2, callback=lambda xk: None)
+        new_points, rewards = minimizer.minimize_batch(points)
+        minimizer.close()
+        assert new_points.shape == points.shape
+        assert judo.allclose(rewards.min(), 0)
+
+    def test_minimizer_n_jobs(self):
+        env = Function(function=sphere, bounds=Bounds(shape=(2,), high=10, low=-5))
+        assert Minimizer(env, n_jobs=-1).n_jobs >= 1
+        with pytest.raises(ValueError):
+            Minimizer(env, n_jobs=0)
+
+    @pytest.mark.skipif(not Backend.is_numpy(), reason="only in numpy for now")
+    def test_minimizer_set_bounds(self):
+        env = Function(function=sphere, bounds=Bounds(shape=(2,), high=10, low=-5))
+        minimizer = Minimizer(env)
+        minimizer.bounds = Bounds(shape=(2,), high=10, low=1, dtype=judo.float)
+        point, reward = minimizer.minimize_point(tensor([5.0, 5.0]))
+        assert judo.allclose(point, tensor([1.0, 1.0]))
+        assert judo.allclose(reward, 2.0)
+
+    @pytest.mark.skipif(not Backend.is_numpy(), reason="only in numpy for now")
+    def test_minimizer_update_bounds(self):
+        env = Function(function=sphere, bounds=Bounds(shape=(2,), high=10, low=-5))
+        minimizer = Minimizer(env)
+        minimizer.minimize_point(tensor([5.0, 5.0]))
+        minimizer.bounds.low = tensor([1.0, 1.0])
+        point, reward = minimizer.minimize_point(tensor([5.0, 5.0]))
+        assert judo.allclose(point, tensor([1.0, 1.0]))
+        assert judo.allclose(reward, 2.0)